@@ -0,0 +1,23 @@
+"""Download the Lottie animations into assets/lottie so the app can serve them offline.
+
+Run once with network access and commit the result:
+
+    python fetch_lottie.py
+"""
+import json
+
+from utils import LOTTIE_DIR, LOTTIE_URLS, fetch_lottie
+
+
+def main():
+    # Fetch everything before writing so a failed run leaves no partial set behind
+    animations = {name: fetch_lottie(name) for name in LOTTIE_URLS}
+    LOTTIE_DIR.mkdir(parents=True, exist_ok=True)
+    for name, animation_json in animations.items():
+        path = LOTTIE_DIR / f"{name}.json"
+        path.write_text(json.dumps(animation_json, separators=(",", ":")), encoding="utf-8")
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
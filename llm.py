@@ -0,0 +1,70 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as sl
+
+DEFAULT_MODEL = "gemini-2.5-flash"
+REPLY_TTL = 3600
+REPLY_CACHE_SIZE = 256
+
+
+@sl.cache_resource
+def get_client():
+    # Secret is read once here instead of on every page rerun
+    from google import genai
+
+    return genai.Client(api_key=sl.secrets["Gemini_API"])
+
+
+@sl.cache_data(ttl=REPLY_TTL, max_entries=REPLY_CACHE_SIZE, show_spinner=False)
+def generate(prompt, model=DEFAULT_MODEL):
+    return get_client().models.generate_content(model=model, contents=prompt).text
+
+
+def stream(prompt, model=DEFAULT_MODEL):
+    for chunk in get_client().models.generate_content_stream(model=model, contents=prompt):
+        yield chunk.text or ""
+
+
+def count_tokens(prompt, model=DEFAULT_MODEL):
+    return get_client().models.count_tokens(model=model, contents=prompt).total_tokens
+
+
+# Streamed replies can't go through st.cache_data, so they are cached here.
+# Shared by every session thread; all access goes through the lock.
+_reply_lock = threading.Lock()
+
+
+@sl.cache_resource
+def _reply_cache():
+    return OrderedDict()
+
+
+def _prompt_key(model, prompt):
+    # Short digest so long prompts don't sit in memory as dict keys
+    return hashlib.blake2b(f"{model}\n{prompt}".encode(), digest_size=16).hexdigest()
+
+
+def get_cached_reply(prompt, model=DEFAULT_MODEL):
+    key = _prompt_key(model, prompt)
+    with _reply_lock:
+        entry = _reply_cache().get(key)
+    if entry and time.monotonic() - entry[0] < REPLY_TTL:
+        return entry[1]
+    return None
+
+
+def set_cached_reply(prompt, reply, model=DEFAULT_MODEL):
+    key = _prompt_key(model, prompt)
+    now = time.monotonic()
+    with _reply_lock:
+        cache = _reply_cache()
+        # Re-insert at the end so insertion order matches timestamp order
+        cache.pop(key, None)
+        while cache and now - next(iter(cache.values()))[0] >= REPLY_TTL:
+            cache.popitem(last=False)
+        if len(cache) >= REPLY_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[key] = (now, reply)
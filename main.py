@@ -1,14 +1,12 @@
 import streamlit as sl
-import requests
 from streamlit_lottie import st_lottie
+from utils import load_lottie
 
 
 def home():
     sl.set_page_config(page_title = "Margadarsaka", page_icon = r"C:\Users\tempe\OneDrive\Documents\Margdarsaka\Margadarsaka\Aldenaire.png")
     sl.logo("Aldenaire.png", size="large")
-    url = "https://lottie.host/179fa302-85e8-4b84-86ff-d6d44b671ae2/yuf3ctwVdH.json"
-    response = requests.get(url)
-    animation_json = response.json()
+    animation_json = load_lottie("home")
     st_lottie(animation_json, height=100, key="lottie1")
     sl.title(":red[MARGADARSAKA]")
     sl.subheader(":green[India's First-AI Powered Education Platform!]")
@@ -17,9 +15,7 @@ def home():
 
     col1, col2, col3 = sl.columns(3)
     with col1:
-            url = "https://lottie.host/08079a40-8ab8-46a2-b930-c0b6a867befe/0viXAHblQr.json"
-            response = requests.get(url)
-            animation_json = response.json()
+            animation_json = load_lottie("home_moat")
             st_lottie(animation_json, height=200, key="lottie2")
 
     sl.html(
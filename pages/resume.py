@@ -2,11 +2,8 @@ import os
 import re
 import streamlit as sl
 from typing import List, Dict, Any, Optional
-from docx import Document
-import spacy
-from PyPDF2 import PdfReader
-import requests
 from streamlit_lottie import st_lottie
+from utils import load_lottie
 
 try:
     from models import ResumeAnalysis, UserProfile
@@ -348,6 +345,8 @@ class ResumeAnalyzer:
         self.ats_scorer = ATSScorer()
         # Try to load spaCy model for NLP analysis
         try:
+            import spacy
+
             self.nlp = spacy.load("en_core_web_sm")
         except Exception:
             self.nlp = None
@@ -413,12 +412,12 @@ class ResumeAnalyzer:
 
     def _extract_from_pdf(self, file_path: str) -> str:
         """Extract text from PDF file"""
-        text = ""
+        from pypdf import PdfReader
+
         try:
             with open(file_path, "rb") as file:
                 pdf_reader = PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() or ""
+                text = "".join(page.extract_text() or "" for page in pdf_reader.pages)
         except Exception as e:
             raise ValueError(f"Error reading PDF: {str(e)}")
 
@@ -426,6 +425,8 @@ class ResumeAnalyzer:
 
     def _extract_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
+        from docx import Document
+
         try:
             doc = Document(file_path)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
@@ -683,9 +684,7 @@ class ResumeAnalyzer:
 # --------------------------
 # Streamlit UI (below)
 # --------------------------
-url = "https://lottie.host/bc577d26-154f-4351-a258-10f73bc918f3/LZXZK5Ce1x.json"
-response = requests.get(url)
-animation_json = response.json()
+animation_json = load_lottie("resume")
 st_lottie(animation_json, height=250, key="lottie2")
 sl.title("ATS Resume Analyzer")
 sl.html(
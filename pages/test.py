@@ -1,14 +1,12 @@
 import streamlit as sl
 from career_test import career_questions
-from google import genai
 from streamlit_lottie import st_lottie
-import requests
+from utils import load_lottie
+import llm
 
 def display_career_test():
     # Lottie Animation
-    url = "https://lottie.host/e5f2d1f4-bf3d-4615-9f76-7ad01529b880/9mPRniZPLk.json"
-    response = requests.get(url)
-    animation_json = response.json()
+    animation_json = load_lottie("test")
     st_lottie(animation_json, height=220, key="lottie2")
 
     sl.markdown(
@@ -28,22 +26,25 @@ def display_career_test():
     if "career_answers" not in sl.session_state:
         sl.session_state.career_answers = [None] * len(career_questions)
 
-    # Display questions with card-like UI
-    for i, q in enumerate(career_questions):
-        with sl.container(border=True):
-            sl.markdown(f"**Q{i+1}. {q['question']}**")
-            answer = sl.radio(
-                "",
-                q['options'],
-                key=f"q{i}",
-                horizontal=True
-            )
-            sl.session_state.career_answers[i] = answer
+    # Display questions with card-like UI; the form holds reruns until submit
+    with sl.form("career_test", border=False):
+        for i, q in enumerate(career_questions):
+            with sl.container(border=True):
+                sl.markdown(f"**Q{i+1}. {q['question']}**")
+                answer = sl.radio(
+                    "",
+                    q['options'],
+                    key=f"q{i}",
+                    horizontal=True
+                )
+                sl.session_state.career_answers[i] = answer
 
-    sl.write("")  # spacing
+        sl.write("")  # spacing
+
+        # Submit button
+        submitted = sl.form_submit_button("✨ Get My Career Suggestions", use_container_width=True)
 
-    # Submit button
-    if sl.button("✨ Get My Career Suggestions", use_container_width=True):
+    if submitted:
         if None in sl.session_state.career_answers:
             sl.warning("⚠️ Please answer all questions before submitting.")
         else:
@@ -60,19 +61,9 @@ def display_career_test():
             """
 
             with sl.spinner("🧠 Analyzing your responses..."):
-                response = client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=prompt
-                )
-
-            career_suggestion = response.text
+                career_suggestion = llm.generate(prompt)
             sl.success("🎯 Recommended Careers:")
             sl.markdown(career_suggestion)
 
 
-# Gemini API
-gemini_api = sl.secrets["Gemini_API"]
-client = genai.Client(api_key=gemini_api)
-model_id = "gemini-2.5-flash"
-
 display_career_test()
@@ -0,0 +1,49 @@
+import atexit
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as sl
+
+LOTTIE_DIR = Path(__file__).parent / "assets" / "lottie"
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+# Source of each bundled animation in assets/lottie; refresh with fetch_lottie.py
+LOTTIE_URLS = {
+    "home": "https://lottie.host/179fa302-85e8-4b84-86ff-d6d44b671ae2/yuf3ctwVdH.json",
+    "home_moat": "https://lottie.host/08079a40-8ab8-46a2-b930-c0b6a867befe/0viXAHblQr.json",
+    "ai": "https://lottie.host/b0c9c03c-2ed7-41b9-81ab-3059b116cfbc/SGfbf7WJGU.json",
+    "resume": "https://lottie.host/bc577d26-154f-4351-a258-10f73bc918f3/LZXZK5Ce1x.json",
+    "roadmap": "https://lottie.host/e1f2f8ef-741c-4b1d-8fc3-03df060f4667/nQh6bnynn8.json",
+    "test": "https://lottie.host/e5f2d1f4-bf3d-4615-9f76-7ad01529b880/9mPRniZPLk.json",
+}
+
+
+@sl.cache_resource
+def _http_client():
+    # Shared keep-alive HTTP/2 client, only built on the first asset cache miss
+    import httpx
+
+    client = httpx.Client(http2=True, timeout=10, headers={"user-agent": "margadarsaka"})
+    atexit.register(client.close)
+    return client
+
+
+def fetch_lottie(name):
+    response = _http_client().get(LOTTIE_URLS[name])
+    response.raise_for_status()
+    return response.json()
+
+
+@sl.cache_data(show_spinner=False)
+def load_lottie(name):
+    # Bundled copy first; the network is only a fallback for a missing asset
+    path = LOTTIE_DIR / f"{name}.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return fetch_lottie(name)
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name):
+    return (PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8")